@@ -1,15 +1,33 @@
 import pygame
+import numpy as np
 import random
-import heapq
 from enum import Enum
+from itertools import permutations
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    from numba import njit
+except ImportError:  # Без numba ядра выполняются как обычный Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Константы
 CELL_SIZE = 6  # Размер клетки в пикселях
 # Размеры сетки
 GRID_WIDTH, GRID_HEIGHT = 101, 101  # Размеры сетки (нечетные числа для корректной генерации лабиринта)
 WINDOW_WIDTH = GRID_WIDTH * CELL_SIZE
 WINDOW_HEIGHT = GRID_HEIGHT * CELL_SIZE
+IDLE_FPS = 30  # Частота опроса событий, когда ничего не анимируется
+INF = 1 << 30  # "Бесконечная" стоимость для непосещенных клеток
+_DIRS = ((-1, 0), (1, 0), (0, -1), (0, 1))  # Соседи клетки: влево, вправо, вверх, вниз
+# Шаги генератора лабиринта (через клетку) и все 24 порядка их перебора
+_CARVE_DX = np.array([-2, 2, 0, 0], dtype=np.int64)
+_CARVE_DY = np.array([0, 0, -2, 2], dtype=np.int64)
+_PERMS4 = np.array(list(permutations(range(4))), dtype=np.int64)
+# Номер младшего установленного бита для 4-битных масок соседей
+_CTZ4 = (0, 0, 1, 0, 2, 0, 1, 0, 3, 0, 1, 0, 2, 0, 1, 0)
 
 # Цвета
 class Colors(Enum):
@@ -22,43 +40,263 @@ class Colors(Enum):
     PURPLE = (160, 32, 240)
     YELLOW = (255, 255, 0)
 
+# Значения цветов для горячих путей отрисовки (без обращений к Enum)
+WHITE = Colors.WHITE.value
+BLACK = Colors.BLACK.value
+GREY = Colors.GREY.value
+GREEN = Colors.GREEN.value
+RED = Colors.RED.value
+BLUE = Colors.BLUE.value
+PURPLE = Colors.PURPLE.value
+YELLOW = Colors.YELLOW.value
+
 pygame.init()
 screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 pygame.display.set_caption("Enhanced Maze Generator")
 clock = pygame.time.Clock()
 
+def pack_walls(grid):
+    """Упаковывает строки сетки в слова uint64: бит x & 63 слова x >> 6 равен 1 для стены."""
+    h, w = grid.shape
+    padded = np.ones((h, (w + 63) // 64 * 64), dtype=np.uint8)
+    padded[:, :w] = grid != 0
+    return np.packbits(padded, axis=1, bitorder="little").view("<u8").astype(np.uint64)
+
+def neighbor_masks(grid):
+    """Строит для каждой свободной клетки 4-битную маску проходимых соседей.
+    
+    Бит d установлен, если открыт сосед в направлении _DIRS[d]; у стен маска 0.
+    Результат — плоский массив uint8 по индексам idx = y*w + x.
+    """
+    free = (grid == 0).astype(np.uint8)
+    mask = np.zeros_like(free)
+    mask[:, 1:] |= free[:, :-1]
+    mask[:, :-1] |= free[:, 1:] << 1
+    mask[1:, :] |= free[:-1, :] << 2
+    mask[:-1, :] |= free[1:, :] << 3
+    mask *= free
+    return mask.ravel()
+
+@njit(cache=True)
+def _is_open(bits, x, y):
+    """Проверяет по битовой маске стен, что клетка (x, y) свободна."""
+    return ((bits[y, x >> 6] >> np.uint64(x & 63)) & np.uint64(1)) == 0
+
+@njit(cache=True)
+def _clear_wall(bits, x, y):
+    """Снимает бит стены клетки (x, y)."""
+    bits[y, x >> 6] &= ~(np.uint64(1) << np.uint64(x & 63))
+
+@njit(cache=True)
+def _carve(grid, bits, w, h, rng_state):
+    """Ядро генерации лабиринта итеративным поиском с возвратом.
+    
+    Вместо random.shuffle порядок направлений берется из таблицы перестановок
+    по значению xorshift-генератора с ненулевым 32-битным состоянием rng_state.
+    Вместе с сеткой обновляется битовая маска стен bits.
+    """
+    stack = np.empty(w*h, dtype=np.int32)
+    state = rng_state
+    grid[1, 1] = 0
+    _clear_wall(bits, 1, 1)
+    stack[0] = w + 1
+    top = 1
+    
+    while top > 0:
+        current = stack[top - 1]
+        x, y = current % w, current // w
+        state ^= (state << 13) & 0xFFFFFFFF
+        state ^= state >> 17
+        state ^= (state << 5) & 0xFFFFFFFF
+        perm = _PERMS4[state % 24]
+        carved = False
+        
+        for k in range(4):
+            nx, ny = x + _CARVE_DX[perm[k]], y + _CARVE_DY[perm[k]]
+            if 1 <= nx < w-1 and 1 <= ny < h-1 and grid[ny, nx] == 1:
+                grid[ny, nx] = 0
+                grid[(y + ny) // 2, (x + nx) // 2] = 0
+                _clear_wall(bits, nx, ny)
+                _clear_wall(bits, (x + nx) // 2, (y + ny) // 2)
+                stack[top] = ny*w + nx
+                top += 1
+                carved = True
+                break
+        if not carved:
+            top -= 1
+
 class MazeGenerator:
     """Класс для генерации лабиринта с использованием алгоритма backtracking."""
     
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self.grid = [[1 for _ in range(width)] for _ in range(height)]
-        self.directions = [(-2, 0), (2, 0), (0, -2), (0, 2)]
+        self.grid = np.ones((height, width), dtype=np.uint8)
+        # Битовая маска стен по строкам (см. pack_walls), ведется вместе с grid
+        self.bits = np.full((height, (width + 63) // 64), np.iinfo(np.uint64).max, dtype=np.uint64)
+        # Маски проходимых соседей (см. neighbor_masks), пересчитываются после генерации
+        self.nbr_mask = np.zeros(width * height, dtype=np.uint8)
     
     def generate(self):
-        """Генерирует лабиринт без анимации."""
-        start = (1, 1)
-        self.grid[start[1]][start[0]] = 0
-        stack = [start]
-        
-        while stack:
-            x, y = stack[-1]
-            random.shuffle(self.directions)
-            carved = False
-
-            # Обработка направлений без анимации
-            for dx, dy in self.directions:
-                nx, ny = x + dx, y + dy
-                if 1 <= nx < self.width-1 and 1 <= ny < self.height-1:
-                    if self.grid[ny][nx] == 1:
-                        self.grid[ny][nx] = 0
-                        self.grid[y + (ny - y) // 2][x + (nx - x) // 2] = 0
-                        stack.append((nx, ny))
-                        carved = True
-                        break
-            if not carved:
-                stack.pop()
+        """Генерирует лабиринт без анимации, перезаписывая grid, bits и nbr_mask на месте."""
+        self.grid.fill(1)
+        self.bits.fill(np.iinfo(np.uint64).max)
+        _carve(self.grid, self.bits, self.width, self.height, random.getrandbits(32) or 1)
+        self.nbr_mask[:] = neighbor_masks(self.grid)
+
+class BucketQueue:
+    """Монотонная очередь с приоритетами для A* с единичной стоимостью шага.
+    
+    При согласованной эвристике приоритеты извлекаемых элементов не убывают,
+    поэтому достаточно массива корзин и указателя на минимальную непустую.
+    Корзина f разбита на подкорзины по эвристике h = f - g: при равных f
+    первой извлекается клетка с меньшим h, то есть с большим g.
+    """
+    
+    def __init__(self):
+        self.buckets = []  # buckets[f][h] — списки элементов
+        self.counts = []   # Число элементов в корзине f
+        self.min_h = []    # Нижняя граница непустых подкорзин корзины f
+        self.min_p = 0
+        self.size = 0
+    
+    def __len__(self):
+        return self.size
+    
+    def push(self, priority, item, h=0):
+        """Добавляет элемент в корзину приоритета priority и подкорзину эвристики h."""
+        buckets = self.buckets
+        while len(buckets) <= priority:
+            buckets.append([])
+            self.counts.append(0)
+            self.min_h.append(INF)
+        inner = buckets[priority]
+        while len(inner) <= h:
+            inner.append([])
+        inner[h].append(item)
+        self.counts[priority] += 1
+        if h < self.min_h[priority]:
+            self.min_h[priority] = h
+        self.size += 1
+    
+    def pop(self):
+        """Извлекает элемент с минимальным приоритетом, а среди них — с минимальным h."""
+        counts = self.counts
+        while not counts[self.min_p]:
+            self.min_p += 1
+        p = self.min_p
+        inner = self.buckets[p]
+        h = self.min_h[p]
+        while not inner[h]:
+            h += 1
+        self.min_h[p] = h
+        counts[p] -= 1
+        self.size -= 1
+        return inner[h].pop()
+
+@njit(cache=True)
+def _heap4_push(keys, items, size, key, item):
+    """Добавляет элемент в 4-арную кучу на массивах; возвращает новый размер."""
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 2
+        if keys[parent] <= key:
+            break
+        keys[i] = keys[parent]
+        items[i] = items[parent]
+        i = parent
+    keys[i] = key
+    items[i] = item
+    return size + 1
+
+@njit(cache=True)
+def _heap4_pop(keys, items, size):
+    """Извлекает элемент с минимальным ключом; size — размер кучи до извлечения."""
+    top = items[0]
+    size -= 1
+    key, item = keys[size], items[size]
+    i = 0
+    while True:
+        first = 4*i + 1
+        if first >= size:
+            break
+        best = first
+        for child in range(first + 1, min(first + 4, size)):
+            if keys[child] < keys[best]:
+                best = child
+        if keys[best] >= key:
+            break
+        keys[i] = keys[best]
+        items[i] = items[best]
+        i = best
+    keys[i] = key
+    items[i] = item
+    return top
+
+@njit(cache=True)
+def _astar_nb(bits, start_idx, end_idx, w, h):
+    """Ядро A* без визуализации на линейных индексах клеток (idx = y*w + x).
+    
+    Проходимость берется из битовой маски стен bits (см. pack_walls).
+    Возвращает массив индексов пути от старта до финиша ([start_idx], если пути нет).
+    """
+    offsets = np.array([-1, 1, -w, w], dtype=np.int64)
+    came_from = np.full(w*h, -1, dtype=np.int32)
+    cost = np.full(w*h, INF, dtype=np.int32)
+    cost[start_idx] = 0
+    ex, ey = end_idx % w, end_idx // w
+    # 4-арная куча (ключ, индекс): каждая клетка добавляется не более 4 раз.
+    # Ключ f*n + (n-1-g) упорядочивает по (f, -g): при равных f раньше
+    # извлекается клетка с большим g, то есть ближе к финишу.
+    n = w*h
+    keys = np.empty(4*n, dtype=np.int64)
+    items = np.empty(4*n, dtype=np.int64)
+    size = _heap4_push(keys, items, 0, n - 1, start_idx)
+    found = False
+    
+    while size > 0:
+        current = _heap4_pop(keys, items, size)
+        size -= 1
+        
+        if current == end_idx:
+            found = True
+            break
+        
+        x, y = current % w, current // w
+        new_cost = cost[current] + 1
+        # 4-битная маска проходимых соседей idx-1, idx+1, idx-w, idx+w
+        mask = 0
+        if x > 0 and _is_open(bits, x - 1, y):
+            mask |= 1
+        if x < w - 1 and _is_open(bits, x + 1, y):
+            mask |= 2
+        if y > 0 and _is_open(bits, x, y - 1):
+            mask |= 4
+        if y < h - 1 and _is_open(bits, x, y + 1):
+            mask |= 8
+        while mask:
+            d = _CTZ4[mask]
+            mask &= mask - 1
+            neighbor = current + offsets[d]
+            if new_cost < cost[neighbor]:
+                cost[neighbor] = new_cost
+                priority = new_cost + abs(neighbor % w - ex) + abs(neighbor // w - ey)
+                size = _heap4_push(keys, items, size, priority*n + (n - 1 - new_cost), neighbor)
+                came_from[neighbor] = current
+    
+    if not found:  # Пути нет — как и в визуализации, остается только старт
+        return np.full(1, start_idx, dtype=np.int32)
+    
+    # Восстановление пути: буфер заполняется с конца, без append/reverse
+    buf = np.empty(w*h, dtype=np.int32)
+    i = w*h - 1
+    buf[i] = end_idx
+    current = end_idx
+    while current != start_idx:
+        current = came_from[current]
+        i -= 1
+        buf[i] = current
+    return buf[i:]
 
 class PathFinder:
     """Класс для поиска пути с использованием алгоритма A* и визуализации."""
@@ -69,48 +307,83 @@ class PathFinder:
         return abs(a[0] - b[0]) + abs(a[1] - b[1])
     
     @classmethod
-    def astar(cls, grid, start, end, visualize=False):
-        """Выполняет поиск пути с визуализацией процесса."""
-        frontier = []
-        heapq.heappush(frontier, (0, start))
-        came_from = {start: None}
-        cost_so_far = {start: 0}
-        visited = set()
+    def astar(cls, grid, start, end, visualize=False, bits=None, nbr_mask=None):
+        """Выполняет поиск пути с визуализацией процесса.
+        
+        При visualize=True на каждом шаге отдает приращения
+        (закрытая клетка, новые клетки фронтира, None), в конце — (None, (), путь).
+        Без визуализации поиск выполняется скомпилированным ядром _astar_nb;
+        bits — готовая маска стен для grid, иначе она строится через pack_walls.
+        nbr_mask — готовые маски соседей для grid, иначе строятся через neighbor_masks.
+        """
+        if not visualize:
+            h, w = grid.shape
+            if bits is None:
+                bits = pack_walls(grid)
+            path = _astar_nb(bits, start[1]*w + start[0], end[1]*w + end[0], w, h)
+            yield None, (), [(i % w, i // w) for i in path.tolist()]
+            return
+        
+        # Клетки кодируются линейным индексом idx = y*w + x
+        h, w = grid.shape
+        if nbr_mask is None:
+            nbr_mask = neighbor_masks(grid)
+        masks = nbr_mask.tolist()
+        start_idx = start[1]*w + start[0]
+        end_idx = end[1]*w + end[0]
+        frontier = BucketQueue()
+        frontier.push(0, start_idx)
+        came_from = [-1] * (w*h)
+        cost = [INF] * (w*h)
+        cost[start_idx] = 0
+        ex, ey = end
+        # Локальные ссылки вместо поиска атрибутов в горячем цикле
+        push = frontier.push
+        pop = frontier.pop
+        dirs = _DIRS
+        ctz = _CTZ4
+        offsets = (-1, 1, -w, w)  # Смещения индекса в порядке _DIRS
         
         while frontier:
-            current = heapq.heappop(frontier)[1]
+            current = pop()
             
-            if current == end:
+            if current == end_idx:
                 break
             
-            for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-                nx, ny = current[0]+dx, current[1]+dy
-                if 0 <= nx < len(grid[0]) and 0 <= ny < len(grid):
-                    if grid[ny][nx] == 0:
-                        neighbor = (nx, ny)
-                        new_cost = cost_so_far[current] + 1
-                        if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                            cost_so_far[neighbor] = new_cost
-                            priority = new_cost + cls.heuristic(end, neighbor)
-                            heapq.heappush(frontier, (priority, neighbor))
-                            came_from[neighbor] = current
+            y, x = divmod(current, w)
+            new_cost = cost[current] + 1
+            new_pushes = []
+            m = masks[current]
+            while m:
+                d = ctz[m]
+                m &= m - 1
+                neighbor = current + offsets[d]
+                if new_cost < cost[neighbor]:
+                    cost[neighbor] = new_cost
+                    dx, dy = dirs[d]
+                    nx, ny = x+dx, y+dy
+                    # Эвристика heuristic(end, (nx, ny)), встроенная в цикл
+                    remaining = abs(nx - ex) + abs(ny - ey)
+                    push(new_cost + remaining, neighbor, remaining)
+                    came_from[neighbor] = current
+                    new_pushes.append((nx, ny))
             
-            visited.add(current)
-        
-        # Восстановление пути
-        path = []
-        current = end
-        while current != start:
-            path.append(current)
-            current = came_from.get(current)
-            if current is None:
-                path = []
+            yield (x, y), tuple(new_pushes), None
+        
+        # Восстановление пути: буфер заполняется с конца, без append/reverse
+        buf = np.empty(w*h, dtype=np.int32)
+        i = w*h - 1
+        buf[i] = end_idx
+        current = end_idx
+        while current != start_idx:
+            current = came_from[current]
+            if current == -1:  # Пути нет — остается только старт
+                i = w*h - 1
+                buf[i] = start_idx
                 break
-            if visualize:
-                yield visited.copy(), frontier.copy(), path.copy()
-        path.append(start)
-        path.reverse()
-        yield visited.copy(), frontier.copy(), path
+            i -= 1
+            buf[i] = current
+        yield None, (), [(idx % w, idx // w) for idx in buf[i:].tolist()]
 
 class GameState:
     """Класс для управления состоянием игры и взаимодействием с пользователем."""
@@ -122,15 +395,37 @@ class GameState:
         self.end = None
         self.path = None
         self.visited = set()
-        self.frontier = []
+        self.frontier_cells = set()
         self.generating = False
         self.solving = False
         self.animation_speed = 0  # Начальная скорость анимации
+        self._bg_surface = None  # Кэшированный фон лабиринта
+        self._full_redraw = True  # Нужна полная перерисовка кадра
+        self._dirty = True  # Кадр изменился с последней отрисовки
+        self._pending_blits = []  # Приращения для частичной перерисовки
+        
+        # Заранее залитые плитки для пакетной отрисовки оверлеев
+        self._grey_tile = self._make_tile(GREY)
+        self._purple_tile = self._make_tile(PURPLE)
+        self._blue_tile = self._make_tile(BLUE)
+        self._green_tile = self._make_tile(GREEN)
+        self._red_tile = self._make_tile(RED)
         
         # Для анимации
         self.gen_iterator = None
         self.astar_iterator = None
         
+    @staticmethod
+    def _make_tile(color):
+        """Создает непрозрачную поверхность размером с клетку, залитую цветом."""
+        tile = pygame.Surface((CELL_SIZE, CELL_SIZE)).convert()
+        tile.fill(color)
+        return tile
+        
+    def _queue_tiles(self, tile, cells):
+        """Ставит клетки в очередь на дорисовку поверх текущего кадра."""
+        self._pending_blits.extend((tile, (x*CELL_SIZE, y*CELL_SIZE)) for x, y in cells)
+        
     def handle_events(self):
         """Обрабатывает пользовательский ввод."""
         for event in pygame.event.get():
@@ -140,19 +435,26 @@ class GameState:
                 self.handle_mouse_click(event)
             if event.type == pygame.KEYDOWN:
                 self.handle_key_press(event)
+            if event.type == pygame.WINDOWEXPOSED:  # Окно нужно перерисовать целиком
+                self._full_redraw = True
+                self._dirty = True
         return True
     
     def handle_mouse_click(self, event):
         """Обрабатывает клики мыши для выбора старта/финиша."""
+        if self.generating:
+            return
         x, y = event.pos
         grid_x = x // CELL_SIZE
         grid_y = y // CELL_SIZE
         
+        self._full_redraw = True
+        self._dirty = True
         if event.button == 1:  # ЛКМ
-            if self.grid[grid_y][grid_x] == 0:
+            if self.grid[grid_y, grid_x] == 0:
                 self.start = (grid_x, grid_y)
         elif event.button == 3:  # ПКМ
-            if self.grid[grid_y][grid_x] == 0:
+            if self.grid[grid_y, grid_x] == 0:
                 self.end = (grid_x, grid_y)
         
         # Если обе точки установлены, запускаем поиск пути
@@ -167,68 +469,108 @@ class GameState:
     def regenerate_maze(self):
         """Перегенерирует лабиринт и сбрасывает состояние"""
         self.generating = True
+        self.solving = False
         self.start = None
         self.end = None
         self.path = None
         self.visited = set()
-        self.frontier = []
-        self.maze = MazeGenerator(GRID_WIDTH, GRID_HEIGHT)  # Создание нового лабиринта
-        self.maze.generate()  # Генерация без анимации
+        self.frontier_cells = set()
+        self._full_redraw = True
+        self._dirty = True
+        self.maze.generate()  # Генерация без анимации в тот же массив self.grid
         
     def start_solving(self):
         """Запускает алгоритм поиска пути"""
         self.solving = True
+        self.path = None
+        self.visited = set()
+        self.frontier_cells = set()
+        self._full_redraw = True
+        self._dirty = True
         self.astar_iterator = PathFinder.astar(
-            self.grid, self.start, self.end, visualize=False  # Включаем визуализацию для размышлений
+            self.grid, self.start, self.end, visualize=False,  # Включаем визуализацию для размышлений
+            bits=self.maze.bits, nbr_mask=self.maze.nbr_mask
         )
     
     def update(self):
         """Обновляет состояние игры"""
         if self.generating:
             self.generating = False
-            self.grid = self.maze.grid
+            self._build_background()
+            # Подсчет свободных и занятых клеток (сетка меняется только при генерации)
+            self.occupied_cells = int(np.count_nonzero(self.grid))
+            self.free_cells = self.grid.size - self.occupied_cells
         
         if self.solving:
             try:
-                self.visited, self.frontier, self.path = next(self.astar_iterator)
+                closed, pushed, path = next(self.astar_iterator)
+                self._dirty = True
+                if closed is not None:
+                    self.visited.add(closed)
+                    self.frontier_cells.discard(closed)
+                    self._queue_tiles(self._grey_tile, (closed,))
+                self.frontier_cells.update(pushed)
+                self._queue_tiles(self._purple_tile, pushed)
+                if path is not None:
+                    self.path = path
+                    self._queue_tiles(self._blue_tile, path)
             except StopIteration:
                 self.solving = False
-        # Подсчет свободных и занятых клеток
-        self.free_cells = sum(row.count(0) for row in self.grid)
-        self.occupied_cells = sum(row.count(1) for row in self.grid)
 
+    def _build_background(self):
+        """Рендерит сетку лабиринта в одну поверхность (только после генерации)"""
+        palette = np.array((WHITE, BLACK), dtype=np.uint8)  # 0 — проход, 1 — стена
+        arr = palette[self.grid]  # (H, W, 3)
+        surface = pygame.surfarray.make_surface(arr.swapaxes(0, 1))
+        self._bg_surface = pygame.transform.scale(surface, (WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+
+    def needs_redraw(self):
+        """Сообщает, изменился ли кадр с последней отрисовки"""
+        return self._dirty
+    
     def draw(self):
         """Отрисовывает текущее состояние"""
-        screen.fill(Colors.BLACK.value)
+        self._dirty = False
+        if not self._full_redraw:
+            self.draw_changes()
+            return
         
-        # Отрисовка сетки
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                color = Colors.WHITE.value if self.grid[y][x] == 0 else Colors.BLACK.value
-                pygame.draw.rect(screen, color, (x*CELL_SIZE, y*CELL_SIZE, CELL_SIZE, CELL_SIZE))
+        # Отрисовка сетки одним блитом (фон покрывает все окно, заливка не нужна)
+        screen.blit(self._bg_surface, (0, 0))
         
         # Отрисовка посещенных ячеек
-        #for x, y in self.visited:
-            #pygame.draw.rect(screen, Colors.GREY.value, (x*CELL_SIZE, y*CELL_SIZE, CELL_SIZE, CELL_SIZE))
+        screen.blits([(self._grey_tile, (x*CELL_SIZE, y*CELL_SIZE)) for x, y in self.visited], doreturn=False)
         
         # Отрисовка фронтера
-        #for _, (x, y) in self.frontier:
-            #pygame.draw.rect(screen, Colors.PURPLE.value, (x*CELL_SIZE, y*CELL_SIZE, CELL_SIZE, CELL_SIZE))
+        screen.blits([(self._purple_tile, (x*CELL_SIZE, y*CELL_SIZE)) for x, y in self.frontier_cells], doreturn=False)
         
         # Отрисовка пути
         if self.path:
-            for x, y in self.path:
-                pygame.draw.rect(screen, Colors.BLUE.value, (x*CELL_SIZE, y*CELL_SIZE, CELL_SIZE, CELL_SIZE))
+            screen.blits([(self._blue_tile, (x*CELL_SIZE, y*CELL_SIZE)) for x, y in self.path], doreturn=False)
         
-        # Отрисовка старта и финиша
-        if self.start:
-            pygame.draw.rect(screen, Colors.GREEN.value, 
-                            (self.start[0]*CELL_SIZE, self.start[1]*CELL_SIZE, CELL_SIZE, CELL_SIZE))
-        if self.end:
-            pygame.draw.rect(screen, Colors.RED.value, 
-                            (self.end[0]*CELL_SIZE, self.end[1]*CELL_SIZE, CELL_SIZE, CELL_SIZE))
+        self.draw_endpoints()
         
         pygame.display.flip()
+        self._full_redraw = False
+        self._pending_blits = []
+    
+    def draw_changes(self):
+        """Дорисовывает только изменившиеся клетки и обновляет их области экрана"""
+        if not self._pending_blits:
+            return
+        dirty = screen.blits(self._pending_blits)
+        dirty.extend(self.draw_endpoints())
+        pygame.display.update(dirty)
+        self._pending_blits = []
+    
+    def draw_endpoints(self):
+        """Отрисовывает старт и финиш поверх остальных слоев"""
+        rects = []
+        if self.start:
+            rects.append(screen.blit(self._green_tile, (self.start[0]*CELL_SIZE, self.start[1]*CELL_SIZE)))
+        if self.end:
+            rects.append(screen.blit(self._red_tile, (self.end[0]*CELL_SIZE, self.end[1]*CELL_SIZE)))
+        return rects
 
 def main():
     """Основная функция игры"""
@@ -237,10 +579,14 @@ def main():
     
     running = True
     while running:
-        clock.tick(game.animation_speed)  # Регулировка скорости анимации
+        # Регулировка скорости анимации; в простое цикл не крутится вхолостую
+        busy = game.generating or game.solving
+        clock.tick(game.animation_speed if busy else IDLE_FPS)
         running = game.handle_events()
         game.update()
-        game.draw()
+        # Перерисовка только при изменениях
+        if game.needs_redraw():
+            game.draw()
     
     pygame.quit()
 